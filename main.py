@@ -42,6 +42,10 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Multi-Agent Development Platform")
     
     try:
+        # Run short coordinator coroutines eagerly (Python 3.12+)
+        from src.orchestration.crew_coordinator import CrewCoordinator
+        CrewCoordinator.configure_loop()
+        
         # Initialize message bus
         await message_bus.connect()
         logger.info("Message bus connected")
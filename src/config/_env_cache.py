@@ -0,0 +1,82 @@
+"""
+Cached .env loader for Multi-Agent Development Platform settings
+
+Parses a dotenv file in a single pass and memoizes the result keyed by the
+file's modification time, so repeated Settings construction does not re-read it.
+"""
+import codecs
+import os
+import re
+from typing import Dict
+
+# path -> mtime of the parsed file, and path -> parsed key/value pairs
+_MTIME_CACHE: Dict[str, float] = {}
+_ENV_CACHE: Dict[str, Dict[str, str]] = {}
+
+_VAR_PATTERN = re.compile(r"\$\{([^}]+)\}")
+
+# Escapes decoded inside quoted values, matching python-dotenv
+_DOUBLE_QUOTE_ESCAPES = re.compile(r"\\[\\'\"abfnrtv]")
+_SINGLE_QUOTE_ESCAPES = re.compile(r"\\[\\']")
+
+
+def _decode_escapes(pattern: "re.Pattern[str]", value: str) -> str:
+    """Replace backslash escapes matched by ``pattern`` with the characters they stand for"""
+    return pattern.sub(lambda match: codecs.decode(match.group(0), "unicode-escape"), value)
+
+
+def _parse(text: str) -> Dict[str, str]:
+    """Parse KEY=VALUE lines, expanding ${VAR} references as they are read"""
+    values: Dict[str, str] = {}
+
+    def expand(match: "re.Match[str]") -> str:
+        name = match.group(1)
+        return os.environ.get(name, values.get(name, ""))
+
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("export "):
+            line = line[7:].lstrip()
+
+        key, sep, value = line.partition("=")
+        if not sep:
+            continue
+        key = key.strip()
+        value = value.strip()
+
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in ("'", '"'):
+            quote = value[0]
+            value = value[1:-1]
+            if quote == '"':
+                value = _VAR_PATTERN.sub(expand, _decode_escapes(_DOUBLE_QUOTE_ESCAPES, value))
+            else:
+                value = _decode_escapes(_SINGLE_QUOTE_ESCAPES, value)
+        else:
+            value = _VAR_PATTERN.sub(expand, value.split(" #", 1)[0].rstrip())
+
+        values[key] = value
+
+    return values
+
+
+def load_env_once(path: str = ".env") -> Dict[str, str]:
+    """
+    Return the parsed contents of a dotenv file
+
+    The file is only re-read when its modification time changes; a missing
+    file yields an empty mapping. The returned dict is shared and must not be
+    mutated by callers.
+    """
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return {}
+
+    if _MTIME_CACHE.get(path) != mtime:
+        with open(path, encoding="utf-8") as env_file:
+            _ENV_CACHE[path] = _parse(env_file.read())
+        _MTIME_CACHE[path] = mtime
+
+    return _ENV_CACHE[path]
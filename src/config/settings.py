@@ -1,15 +1,30 @@
 """
 Configuration management for Multi-Agent Development Platform
 """
-import os
-from typing import Optional, List, Dict, Any
+from functools import cached_property
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Mapping
 try:
-    from pydantic_settings import BaseSettings
+    from pydantic_settings import BaseSettings, EnvSettingsSource
     from pydantic import validator
 except ImportError:
     from pydantic import BaseSettings, validator
+    EnvSettingsSource = None
 from pathlib import Path
 
+from ._env_cache import load_env_once
+
+
+if EnvSettingsSource is not None:
+    class _CachedDotEnvSource(EnvSettingsSource):
+        """Settings source reading the cached .env parse instead of os.environ"""
+        
+        def _load_env_vars(self) -> Mapping[str, Optional[str]]:
+            values = load_env_once()
+            if self.case_sensitive:
+                return values
+            return {key.lower(): value for key, value in values.items()}
+
 
 class Settings(BaseSettings):
     """Application settings with environment variable support"""
@@ -65,6 +80,19 @@ class Settings(BaseSettings):
             return f"redis://:{password}@{values.get('redis_host')}:{values.get('redis_port')}/{values.get('redis_db')}"
         return f"redis://{values.get('redis_host')}:{values.get('redis_port')}/{values.get('redis_db')}"
     
+    # Message bus publish connection pool size
+    redis_pool_size: int = 20
+    
+    # Message bus publish batching
+    redis_batch_size: int = 100
+    redis_flush_interval_ms: float = 1.0
+    redis_publish_queue_size: int = 10000
+    redis_max_inflight_publishes: int = 1024
+    
+    # Message bus dispatch: worker tasks and queue bound per registered handler
+    message_handler_workers: int = 1
+    message_handler_queue_size: int = 1000
+    
     # =============================================================================
     # LLM API Configuration
     # =============================================================================
@@ -83,6 +111,7 @@ class Settings(BaseSettings):
     agent_timeout: int = 300
     max_concurrent_agents: int = 5
     agent_retry_attempts: int = 3
+    max_concurrent_workflows: int = 4
     
     # Cost Control
     monthly_budget_usd: float = 140.0
@@ -143,13 +172,27 @@ class Settings(BaseSettings):
     enable_telemetry: bool = True
     
     class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
         case_sensitive = False
         
         # Environment variable prefixes
         env_prefix = ""
         
+        # pydantic v1 has no pluggable sources; let it read .env itself
+        if EnvSettingsSource is None:
+            env_file = ".env"
+    
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: Any,
+        init_settings: Any,
+        env_settings: Any,
+        dotenv_settings: Any,
+        file_secret_settings: Any
+    ) -> tuple:
+        """Read .env through the mtime-cached parser; real env vars still win over it"""
+        return init_settings, env_settings, _CachedDotEnvSource(settings_cls), file_secret_settings
+        
     @property
     def is_development(self) -> bool:
         """Check if running in development mode"""
@@ -172,10 +215,10 @@ class AgentConfig:
     def __init__(self, settings: Settings):
         self.settings = settings
         
-    @property
-    def developer_agent_config(self) -> Dict[str, Any]:
+    @cached_property
+    def developer_agent_config(self) -> Mapping[str, Any]:
         """Configuration for Developer Agent"""
-        return {
+        return MappingProxyType({
             "role": "Senior Full-Stack Developer",
             "goal": "Write high-quality, maintainable code following best practices",
             "backstory": """
@@ -187,12 +230,12 @@ class AgentConfig:
             "allow_delegation": True,
             "max_iter": 3,
             "memory": True
-        }
+        })
     
-    @property
-    def reviewer_agent_config(self) -> Dict[str, Any]:
+    @cached_property
+    def reviewer_agent_config(self) -> Mapping[str, Any]:
         """Configuration for Reviewer Agent"""
-        return {
+        return MappingProxyType({
             "role": "Code Quality Specialist",
             "goal": "Ensure code quality, security, and adherence to best practices",
             "backstory": """
@@ -204,7 +247,7 @@ class AgentConfig:
             "allow_delegation": False,
             "max_iter": 2,
             "memory": True
-        }
+        })
 
 
 class DatabaseConfig:
@@ -213,17 +256,17 @@ class DatabaseConfig:
     def __init__(self, settings: Settings):
         self.settings = settings
     
-    @property
-    def database_config(self) -> Dict[str, Any]:
+    @cached_property
+    def database_config(self) -> Mapping[str, Any]:
         """SQLAlchemy database configuration"""
-        return {
+        return MappingProxyType({
             "url": self.settings.database_url,
             "echo": self.settings.debug,
             "pool_size": 5,
             "max_overflow": 10,
             "pool_timeout": 30,
             "pool_recycle": 3600
-        }
+        })
 
 
 class RedisConfig:
@@ -232,10 +275,10 @@ class RedisConfig:
     def __init__(self, settings: Settings):
         self.settings = settings
     
-    @property
-    def redis_config(self) -> Dict[str, Any]:
+    @cached_property
+    def redis_config(self) -> Mapping[str, Any]:
         """Redis client configuration"""
-        return {
+        return MappingProxyType({
             "host": self.settings.redis_host,
             "port": self.settings.redis_port,
             "password": self.settings.redis_password if self.settings.redis_password else None,
@@ -244,11 +287,21 @@ class RedisConfig:
             "socket_timeout": 5,
             "socket_connect_timeout": 5,
             "health_check_interval": 30
-        }
+        })
+
+
+class _FastSettings:
+    """Plain slotted snapshot of the settings read on hot paths"""
+    __slots__ = ('debug', 'log_level', 'agent_timeout', 'max_concurrent_agents', 'enable_metrics')
+    
+    def __init__(self, settings: Settings):
+        for name in self.__slots__:
+            setattr(self, name, getattr(settings, name))
 
 
 # Global settings instance
 settings = Settings()
+fast_settings = _FastSettings(settings)
 
 # Configuration helpers
 agent_config = AgentConfig(settings)
@@ -5,9 +5,11 @@ This module provides the foundational Agent class that all specialized agents in
 It integrates with CrewAI and provides common functionality for all agents.
 """
 
+import sys
 import logging
 import asyncio
-from typing import Any, Dict, List, Optional, Union
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
 from datetime import datetime
 from abc import ABC, abstractmethod
 
@@ -15,7 +17,20 @@ from crewai import Agent
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
-from ..config.settings import settings
+from ..config.settings import settings, fast_settings
+
+
+# [epoch second, isoformat string] of the last formatted status timestamp
+_TS_CACHE = [0, '']
+
+
+def _now_iso() -> str:
+    """Return the current time in ISO format, reformatted at most once per second"""
+    now = int(time.time())
+    if now != _TS_CACHE[0]:
+        _TS_CACHE[0] = now
+        _TS_CACHE[1] = datetime.fromtimestamp(now).isoformat()
+    return _TS_CACHE[1]
 
 
 class TaskResult(BaseModel):
@@ -42,6 +57,70 @@ class AgentMetrics(BaseModel):
     last_activity: Optional[datetime] = None
 
 
+class _MockAgent:
+    """Stand-in for a CrewAI agent used when LLM responses are mocked"""
+    __slots__ = ('role', 'goal', 'backstory', 'tools')
+    
+    def __init__(self, role: str, goal: str, backstory: str, tools: List[BaseTool]):
+        self.role = role
+        self.goal = goal
+        self.backstory = backstory
+        self.tools = tools
+    
+    def __repr__(self) -> str:
+        return f"<_MockAgent(role={self.role})>"
+
+
+class Outcome:
+    """Explicit success/failure result that process_task may return instead of raising"""
+    __slots__ = ('ok', 'value', 'error')
+    
+    def __init__(self, ok: bool, value: Any = None, error: Optional[BaseException] = None):
+        self.ok = ok
+        self.value = value
+        self.error = error
+    
+    @classmethod
+    def success(cls, value: Any) -> "Outcome":
+        return cls(True, value=value)
+    
+    @classmethod
+    def failure(cls, error: BaseException) -> "Outcome":
+        return cls(False, error=error)
+
+
+class _Counters:
+    """Raw task counters backing AgentMetrics, updated without validation"""
+    __slots__ = ('completed', 'failed', 'total_time', 'last_activity')
+    
+    def __init__(self):
+        self.completed = 0
+        self.failed = 0
+        self.total_time = 0.0
+        self.last_activity: Optional[datetime] = None
+    
+    @property
+    def success_rate(self) -> float:
+        total = self.completed + self.failed
+        return self.completed / total if total else 0.0
+    
+    @property
+    def average_execution_time(self) -> float:
+        return self.total_time / self.completed if self.completed else 0.0
+
+
+# Metric name -> reader over the agent's counters, in AgentMetrics field order
+_METRIC_READERS = {
+    'agent_id': lambda agent: agent.agent_id,
+    'tasks_completed': lambda agent: agent._c.completed,
+    'tasks_failed': lambda agent: agent._c.failed,
+    'total_execution_time': lambda agent: agent._c.total_time,
+    'average_execution_time': lambda agent: agent._c.average_execution_time,
+    'success_rate': lambda agent: agent._c.success_rate,
+    'last_activity': lambda agent: agent._c.last_activity,
+}
+
+
 class BaseMultiAgent(ABC):
     """
     Base class for all Multi-Agent Development Platform agents
@@ -62,11 +141,11 @@ class BaseMultiAgent(ABC):
         memory: bool = True,
         tools: Optional[List[BaseTool]] = None
     ):
-        self.agent_id = agent_id or f"{self.__class__.__name__}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.agent_id = agent_id or f"{self.__class__.__name__}_{time.time_ns():x}"
         self.role = role
         self.goal = goal
         self.backstory = backstory
-        self.verbose = verbose if verbose is not None else settings.debug
+        self.verbose = verbose if verbose is not None else fast_settings.debug
         self.allow_delegation = allow_delegation
         self.max_iter = max_iter
         self.memory = memory
@@ -75,22 +154,43 @@ class BaseMultiAgent(ABC):
         # Initialize logging
         self.logger = self._setup_logger()
         
-        # Initialize metrics
-        self.metrics = AgentMetrics(agent_id=self.agent_id)
+        # Initialize metrics counters (see the ``metrics`` property)
+        self._c = _Counters()
         
         # Initialize CrewAI agent
         self.crew_agent = self._create_crew_agent()
         
         # Task tracking
         self.current_tasks: Dict[str, TaskResult] = {}
+        self._current_count = 0
         self.completed_tasks: List[TaskResult] = []
         
         self.logger.info(f"Agent {self.agent_id} initialized successfully")
     
+    @property
+    def metrics(self) -> AgentMetrics:
+        """Snapshot of the agent's performance metrics"""
+        c = self._c
+        return AgentMetrics(
+            agent_id=self.agent_id,
+            tasks_completed=c.completed,
+            tasks_failed=c.failed,
+            total_execution_time=c.total_time,
+            average_execution_time=c.average_execution_time,
+            success_rate=c.success_rate,
+            last_activity=c.last_activity
+        )
+    
+    def _metrics_view(self, fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        """Build a metrics dict straight from the counters, limited to ``fields`` if given"""
+        if fields is None:
+            return {name: read(self) for name, read in _METRIC_READERS.items()}
+        return {name: _METRIC_READERS[name](self) for name in fields}
+    
     def _setup_logger(self) -> logging.Logger:
         """Setup structured logging for the agent"""
         logger = logging.getLogger(f"agent.{self.agent_id}")
-        logger.setLevel(getattr(logging, settings.log_level.upper()))
+        logger.setLevel(getattr(logging, fast_settings.log_level.upper()))
         
         if not logger.handlers:
             handler = logging.StreamHandler()
@@ -102,8 +202,11 @@ class BaseMultiAgent(ABC):
         
         return logger
     
-    def _create_crew_agent(self) -> Agent:
+    def _create_crew_agent(self) -> Union[Agent, _MockAgent]:
         """Create and configure the underlying CrewAI agent"""
+        if settings.mock_llm_responses:
+            return _MockAgent(self.role, self.goal, self.backstory, self.tools)
+        
         try:
             agent = Agent(
                 role=self.role,
@@ -121,7 +224,7 @@ class BaseMultiAgent(ABC):
             raise
     
     @abstractmethod
-    async def process_task(self, task_description: str, context: Dict[str, Any] = None) -> TaskResult:
+    async def process_task(self, task_description: str, context: Dict[str, Any] = None) -> Union[TaskResult, Outcome]:
         """
         Process a task assigned to this agent
         
@@ -130,7 +233,8 @@ class BaseMultiAgent(ABC):
             context: Additional context and parameters for the task
             
         Returns:
-            TaskResult: The result of task processing
+            Union[TaskResult, Outcome]: The result of task processing. Return
+            ``Outcome.failure(error)`` to report an expected failure without raising.
         """
         pass
     
@@ -146,6 +250,7 @@ class BaseMultiAgent(ABC):
         Returns:
             TaskResult: The result of task execution
         """
+        task_id = sys.intern(task_id)
         start_time = datetime.now()
         context = context or {}
         
@@ -158,52 +263,48 @@ class BaseMultiAgent(ABC):
         )
         
         # Track current task
+        if task_id not in self.current_tasks:
+            self._current_count += 1
         self.current_tasks[task_id] = task_result
         
         self.logger.info(f"Starting task {task_id}: {task_description}")
         
         try:
-            # Process the task
-            result = await self.process_task(task_description, context)
-            
-            # Update task result
-            completed_at = datetime.now()
-            execution_time = (completed_at - start_time).total_seconds()
-            
-            task_result.status = "completed"
-            task_result.result = result.result if isinstance(result, TaskResult) else result
-            task_result.completed_at = completed_at
-            task_result.execution_time = execution_time
-            
-            # Update metrics
-            self.metrics.tasks_completed += 1
-            self.metrics.total_execution_time += execution_time
-            self.metrics.average_execution_time = self.metrics.total_execution_time / self.metrics.tasks_completed
-            self.metrics.success_rate = self.metrics.tasks_completed / (self.metrics.tasks_completed + self.metrics.tasks_failed)
-            self.metrics.last_activity = completed_at
+            # Process the task; unexpected errors are folded into a failed outcome
+            try:
+                result = await self.process_task(task_description, context)
+            except Exception as e:
+                result = Outcome.failure(e)
             
-            self.logger.info(f"Task {task_id} completed successfully in {execution_time:.2f}s")
+            if not isinstance(result, Outcome):
+                result = Outcome.success(result.result if isinstance(result, TaskResult) else result)
             
-        except Exception as e:
-            # Handle task failure
+            # Update task result
             completed_at = datetime.now()
             execution_time = (completed_at - start_time).total_seconds()
             
-            task_result.status = "failed"
-            task_result.error = str(e)
             task_result.completed_at = completed_at
             task_result.execution_time = execution_time
+            self._c.last_activity = completed_at
             
-            # Update metrics
-            self.metrics.tasks_failed += 1
-            self.metrics.success_rate = self.metrics.tasks_completed / (self.metrics.tasks_completed + self.metrics.tasks_failed) if (self.metrics.tasks_completed + self.metrics.tasks_failed) > 0 else 0
-            self.metrics.last_activity = completed_at
-            
-            self.logger.error(f"Task {task_id} failed after {execution_time:.2f}s: {e}")
+            if result.ok:
+                task_result.status = "completed"
+                task_result.result = result.value
+                self._c.completed += 1
+                self._c.total_time += execution_time
+                
+                self.logger.info(f"Task {task_id} completed successfully in {execution_time:.2f}s")
+            else:
+                task_result.status = "failed"
+                task_result.error = str(result.error)
+                self._c.failed += 1
+                
+                self.logger.error(f"Task {task_id} failed after {execution_time:.2f}s: {result.error}")
         
         finally:
             # Move to completed tasks
-            self.current_tasks.pop(task_id, None)
+            if self.current_tasks.pop(task_id, None) is not None:
+                self._current_count -= 1
             self.completed_tasks.append(task_result)
             
             # Limit completed tasks history
@@ -217,10 +318,10 @@ class BaseMultiAgent(ABC):
         return {
             "agent_id": self.agent_id,
             "role": self.role,
-            "status": "busy" if self.current_tasks else "idle",
-            "current_tasks": len(self.current_tasks),
-            "metrics": self.metrics.dict(),
-            "uptime": datetime.now().isoformat()
+            "status": "busy" if self._current_count else "idle",
+            "current_tasks": self._current_count,
+            "metrics": self._metrics_view(),
+            "uptime": _now_iso()
         }
     
     def get_task_history(self, limit: int = 10) -> List[TaskResult]:
@@ -254,15 +355,15 @@ class BaseMultiAgent(ABC):
             health_status = {
                 "agent_id": self.agent_id,
                 "status": "healthy",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
                 "tools_count": len(self.tools),
-                "current_tasks": len(self.current_tasks),
-                "metrics": self.metrics.dict()
+                "current_tasks": self._current_count,
+                "metrics": self._metrics_view(('tasks_completed', 'tasks_failed', 'success_rate'))
             }
             
             # Check if agent has been inactive for too long
-            if self.metrics.last_activity:
-                inactive_time = datetime.now() - self.metrics.last_activity
+            if self._c.last_activity:
+                inactive_time = datetime.now() - self._c.last_activity
                 if inactive_time.total_seconds() > 3600:  # 1 hour
                     health_status["warnings"] = ["Agent has been inactive for over 1 hour"]
             
@@ -273,7 +374,7 @@ class BaseMultiAgent(ABC):
                 "agent_id": self.agent_id,
                 "status": "unhealthy",
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
     
     def __repr__(self) -> str:
@@ -5,19 +5,29 @@ This module provides Redis-based pub/sub messaging for inter-agent communication
 and task coordination in the Multi-Agent Development Platform.
 """
 
-import json
 import asyncio
+import heapq
+import itertools
 import logging
-from typing import Any, Dict, List, Optional, Callable, Awaitable
+import time
+from typing import Any, Dict, Iterable, List, Optional, Callable, Awaitable, Set, Union
 from datetime import datetime
+from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
 
+import orjson
 import redis.asyncio as redis
+from redis.exceptions import NoScriptError, ResponseError
 from pydantic import BaseModel, Field
 
 from ..config.settings import settings
 
 
+# Monotonic suffix keeps ids unique even when time_ns() repeats
+_ID_COUNTER = itertools.count()
+
+
 class MessageType(str, Enum):
     """Message types for agent communication"""
     TASK_REQUEST = "task_request"
@@ -28,9 +38,33 @@ class MessageType(str, Enum):
     COORDINATION = "coordination"
 
 
+# Publish a payload and record it in a sorted-set history in one round-trip
+# KEYS: channel, history key; ARGV: payload, score. Returns the PUBLISH count.
+_PUBLISH_WITH_HISTORY_LUA = (
+    "local n = redis.call('PUBLISH', KEYS[1], ARGV[1]) "
+    "redis.call('ZADD', KEYS[2], ARGV[2], ARGV[1]) "
+    "return n"
+)
+
+@lru_cache(maxsize=4096)
+def _agent_channel(agent_id: str) -> str:
+    """Channel carrying messages addressed to an agent"""
+    return f"agent_{agent_id}"
+
+
+@lru_cache(maxsize=4096)
+def _agent_responses_channel(agent_id: str) -> str:
+    """Channel carrying responses to requests sent by an agent"""
+    return f"agent_{agent_id}_responses"
+
+
+# Wire value -> MessageType, avoiding EnumMeta.__call__ on every decoded message
+_MESSAGE_TYPES: Dict[str, MessageType] = {member.value: member for member in MessageType}
+
+
 class Message(BaseModel):
     """Standardized message format for agent communication"""
-    id: str = Field(default_factory=lambda: f"msg_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}")
+    id: str = Field(default_factory=lambda: f"msg_{time.time_ns()}_{next(_ID_COUNTER)}")
     type: MessageType
     sender_id: str
     recipient_id: Optional[str] = None  # None for broadcast messages
@@ -39,10 +73,59 @@ class Message(BaseModel):
     correlation_id: Optional[str] = None  # For request/response tracking
     priority: int = Field(default=5, ge=1, le=10)  # 1=highest, 10=lowest
     expires_at: Optional[datetime] = None
+    
+    def to_bytes(self) -> bytes:
+        """Serialize the message to JSON bytes for the wire"""
+        return orjson.dumps(
+            {
+                "id": self.id,
+                "type": self.type,
+                "sender_id": self.sender_id,
+                "recipient_id": self.recipient_id,
+                "payload": self.payload,
+                "timestamp": self.timestamp,
+                "correlation_id": self.correlation_id,
+                "priority": self.priority,
+                "expires_at": self.expires_at,
+            },
+            default=_json_default,
+            option=orjson.OPT_NON_STR_KEYS
+        )
+    
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, str], trusted_senders: Optional[Set[str]] = None) -> "Message":
+        """
+        Rebuild a message produced by to_bytes
+        
+        Validation is skipped for trusted producers. When ``trusted_senders`` is
+        given, messages from any other sender are fully validated instead.
+        """
+        fields = orjson.loads(data)
+        if trusted_senders is not None and fields.get("sender_id") not in trusted_senders:
+            return cls.model_validate(fields)
+        
+        fields["type"] = _MESSAGE_TYPES[fields["type"]]
+        fields["timestamp"] = datetime.fromisoformat(fields["timestamp"])
+        if fields.get("expires_at"):
+            fields["expires_at"] = datetime.fromisoformat(fields["expires_at"])
+        return cls.model_construct(**fields)
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback encoder for payload values orjson cannot serialize natively"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Decimal):
+        # Same as pydantic's JSON mode, which keeps full precision as a string
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 class MessageHandler:
     """Base class for message handlers"""
+    __slots__ = ('handler_id', 'logger')
     
     def __init__(self, handler_id: str):
         self.handler_id = handler_id
@@ -53,49 +136,216 @@ class MessageHandler:
         raise NotImplementedError
 
 
+class _HandlerQueue:
+    """
+    Bounded (priority, seq, message) min-heap that evicts its worst entry when full
+    
+    Lower tuples are delivered first. Kept separate from asyncio.PriorityQueue
+    so eviction only touches a heap this class owns.
+    """
+    __slots__ = ('maxsize', '_heap', '_not_empty')
+    
+    def __init__(self, maxsize: int = 0):
+        self.maxsize = maxsize
+        self._heap: List[tuple] = []
+        self._not_empty = asyncio.Event()
+    
+    def qsize(self) -> int:
+        """Number of queued entries"""
+        return len(self._heap)
+    
+    def full(self) -> bool:
+        """True if the queue holds ``maxsize`` entries (never full when maxsize <= 0)"""
+        return 0 < self.maxsize <= len(self._heap)
+    
+    def put_evicting(self, item: tuple) -> Optional[tuple]:
+        """Enqueue ``item``, returning whichever entry was dropped to make room (if any)"""
+        heap = self._heap
+        if not self.full():
+            heapq.heappush(heap, item)
+            self._not_empty.set()
+            return None
+        
+        # The largest entry of a min-heap is a leaf, so replacing it only needs a sift up
+        pos = max(range(len(heap)), key=heap.__getitem__)
+        if not item < heap[pos]:
+            return item
+        
+        evicted = heap[pos]
+        heap[pos] = item
+        while pos > 0:
+            parent = (pos - 1) >> 1
+            if not heap[pos] < heap[parent]:
+                break
+            heap[pos], heap[parent] = heap[parent], heap[pos]
+            pos = parent
+        return evicted
+    
+    async def get(self) -> tuple:
+        """Remove and return the smallest entry, waiting until one is available"""
+        while not self._heap:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return heapq.heappop(self._heap)
+
+
 class MessageBus:
     """Redis-based message bus for agent communication"""
     
     def __init__(self):
-        self.redis_client: Optional[redis.Redis] = None
+        self.redis_client: Optional[redis.Redis] = None  # control commands (ping, health)
+        self._pub_client: Optional[redis.Redis] = None
+        self._sub_client: Optional[redis.Redis] = None
+        self._pools: List[redis.ConnectionPool] = []
+        self._publish_script_sha: Optional[str] = None  # loaded on first publish_with_history
+        self._scripting_available = True
         self.logger = logging.getLogger("message_bus")
         self.handlers: Dict[str, MessageHandler] = {}
         self.subscriptions: Dict[str, List[str]] = {}  # channel -> handler_ids
         self.running = False
-        self.listener_tasks: List[asyncio.Task] = []
+        
+        # Senders whose messages skip validation on receive; None trusts every sender
+        self.trusted_senders: Optional[Set[str]] = None
+        
+        # One pubsub connection and listener task multiplex every subscribed channel
+        self._pubsub: Optional[redis.client.PubSub] = None
+        self._listener_task: Optional[asyncio.Task] = None
+        
+        # Per-handler inbound priority queues consumed by long-lived worker tasks;
+        # the sequence number keeps FIFO order within a priority level
+        self._handler_queues: Dict[str, _HandlerQueue] = {}
+        self._dispatch_seq = itertools.count()
+        self._handler_workers: Dict[str, List[asyncio.Task]] = {}
+        self.dropped_messages = 0
+        self.expired_messages = 0
+        
+        # request_response futures keyed by correlation_id, resolved by one shared handler
+        self._pending_responses: Dict[str, asyncio.Future] = {}
+        self._response_router = _ResponseRouter(self._pending_responses)
+        
+        # Publish batching: (channel, payload, future or None) entries drained by _flush_publishes
+        self._publish_queue: Optional[asyncio.Queue] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._publish_sem: Optional[asyncio.Semaphore] = None
+        self._cleanup_tasks: Set[asyncio.Task] = set()
     
     async def connect(self) -> None:
         """Connect to Redis"""
         try:
-            self.redis_client = redis.from_url(
+            # Separate pools so stateful pub/sub connections never starve publishers.
+            # The capped pools block (up to 5s) for a free connection instead of raising.
+            control_pool = redis.BlockingConnectionPool.from_url(
+                settings.redis_url,
+                max_connections=2,
+                timeout=5,
+                decode_responses=True,
+                socket_timeout=5,
+                socket_connect_timeout=5
+            )
+            # Pipelined batches are packed into one buffer and flushed with a single write;
+            # keepalive keeps those long-lived publisher sockets from being silently dropped
+            pub_pool = redis.BlockingConnectionPool.from_url(
                 settings.redis_url,
+                max_connections=settings.redis_pool_size,
+                timeout=5,
                 decode_responses=True,
                 socket_timeout=5,
+                socket_connect_timeout=5,
+                socket_keepalive=True
+            )
+            # All subscriptions are multiplexed over one PubSub, so one connection is enough.
+            # No socket_timeout: it blocks reading until a message arrives.
+            # Payloads stay raw bytes so orjson parses them without an intermediate str.
+            sub_pool = redis.ConnectionPool.from_url(
+                settings.redis_url,
+                max_connections=1,
+                decode_responses=False,
                 socket_connect_timeout=5
             )
+            self._pools = [control_pool, pub_pool, sub_pool]
+            
+            self.redis_client = redis.Redis(connection_pool=control_pool)
+            self._pub_client = redis.Redis(connection_pool=pub_pool)
+            self._sub_client = redis.Redis(connection_pool=sub_pool)
+            self._pubsub = self._sub_client.pubsub()
             
             # Test connection
             await self.redis_client.ping()
+            self.running = True
+            self._scripting_available = True
+            
+            # Start the background publisher that pipelines queued messages
+            self._publish_queue = asyncio.Queue(maxsize=settings.redis_publish_queue_size)
+            self._publish_sem = asyncio.Semaphore(settings.redis_max_inflight_publishes)
+            self._flusher_task = asyncio.create_task(self._flush_publishes())
+            
+            # Restore subscriptions kept across a previous disconnect on the new connection
+            if self.subscriptions:
+                await self._pubsub.subscribe(*self.subscriptions)
+                for handler_ids in self.subscriptions.values():
+                    for handler_id in handler_ids:
+                        if handler_id in self.handlers:
+                            self._start_handler_workers(handler_id)
+                self._listener_task = asyncio.create_task(self._listen())
+            
             self.logger.info("Connected to Redis message bus")
             
         except Exception as e:
             self.logger.error(f"Failed to connect to Redis: {e}")
+            # Release whatever was set up before the failure
+            try:
+                await self.disconnect()
+            except Exception as cleanup_error:
+                self.logger.warning(f"Error cleaning up failed connection: {cleanup_error}")
             raise
     
     async def disconnect(self) -> None:
         """Disconnect from Redis and cleanup"""
         self.running = False
         
-        # Cancel listener tasks
-        for task in self.listener_tasks:
-            task.cancel()
+        # Stop the publisher and fail anything still waiting to be sent
+        if self._flusher_task:
+            self._flusher_task.cancel()
+            await asyncio.gather(self._flusher_task, return_exceptions=True)
+            self._flusher_task = None
+        
+        if self._publish_queue:
+            while not self._publish_queue.empty():
+                _, _, future = self._publish_queue.get_nowait()
+                if future and not future.done():
+                    future.set_exception(RuntimeError("Message bus disconnected"))
+            self._publish_queue = None
         
-        if self.listener_tasks:
-            await asyncio.gather(*self.listener_tasks, return_exceptions=True)
+        # Fail requests still waiting on a response
+        for future in self._pending_responses.values():
+            if not future.done():
+                future.set_exception(RuntimeError("Message bus disconnected"))
+        self._pending_responses.clear()
         
-        # Close Redis connection
+        # Stop handler workers
+        for handler_id in list(self._handler_workers):
+            await self._stop_handler_workers(handler_id)
+        
+        # Stop the shared listener and release its pubsub connection
+        if self._listener_task:
+            self._listener_task.cancel()
+            await asyncio.gather(self._listener_task, return_exceptions=True)
+            self._listener_task = None
+        
+        if self._pubsub:
+            try:
+                await self._pubsub.close()
+            except Exception as e:
+                self.logger.warning(f"Error closing pubsub connection: {e}")
+            self._pubsub = None
+        
+        # Close Redis connections
         if self.redis_client:
-            await self.redis_client.close()
+            for client in (self.redis_client, self._pub_client, self._sub_client):
+                await client.close()
+            for pool in self._pools:
+                await pool.disconnect()
+            self._pools = []
             self.logger.info("Disconnected from Redis message bus")
     
     async def publish(self, channel: str, message: Message) -> int:
@@ -109,24 +359,177 @@ class MessageBus:
         Returns:
             int: Number of subscribers that received the message
         """
-        if not self.redis_client:
+        if not self.redis_client or not self._publish_queue:
             raise RuntimeError("Message bus not connected")
         
         try:
-            message_json = message.json()
-            result = await self.redis_client.publish(channel, message_json)
+            data = message.to_bytes()
+            
+            # Hand off to the batching publisher and wait for this message's reply,
+            # blocking while too many confirmed publishes are in flight or the queue is full
+            async with self._publish_sem:
+                future = asyncio.get_running_loop().create_future()
+                await self._publish_queue.put((channel, data, future))
+                result = await future
             
             self.logger.debug(
-                f"Published message {message.id} to channel {channel}, "
-                f"delivered to {result} subscribers"
+                "Published message %s to channel %s, delivered to %d subscribers",
+                message.id, channel, result
             )
             
             return result
             
         except Exception as e:
-            self.logger.error(f"Failed to publish message to {channel}: {e}")
+            self.logger.error("Failed to publish message to %s: %s", channel, e)
             raise
     
+    async def broadcast(self, channels: List[str], message: Message) -> List[int]:
+        """
+        Publish the same message to several channels in one round-trip
+        
+        The message is serialized once and the PUBLISH commands are sent
+        together in a single pipeline.
+        
+        Args:
+            channels: Channel names to publish to
+            message: Message to publish
+            
+        Returns:
+            List[int]: Number of subscribers reached on each channel, in order
+        """
+        if not self._pub_client:
+            raise RuntimeError("Message bus not connected")
+        
+        if not channels:
+            return []
+        
+        try:
+            data = message.to_bytes()
+            pipe = self._pub_client.pipeline(transaction=False)
+            for channel in channels:
+                pipe.publish(channel, data)
+            results = await pipe.execute()
+            
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Broadcast message %s to %d channels, delivered to %d subscribers",
+                    message.id, len(channels), sum(results)
+                )
+            
+            return results
+            
+        except Exception as e:
+            self.logger.error("Failed to broadcast message to %d channels: %s", len(channels), e)
+            raise
+    
+    async def publish_with_history(self, channel: str, message: Message, history_key: str) -> int:
+        """
+        Publish a message and add it to a sorted-set history in one round-trip
+        
+        Runs a Lua script, loaded on first use. If Redis has dropped the script
+        it is reloaded next time; if scripting is not permitted at all, a
+        PUBLISH + ZADD pipeline is used instead.
+        
+        Args:
+            channel: Channel name to publish to
+            message: Message to publish
+            history_key: Sorted set receiving the payload, scored by message timestamp
+            
+        Returns:
+            int: Number of subscribers that received the message
+        """
+        if not self._pub_client:
+            raise RuntimeError("Message bus not connected")
+        
+        data = message.to_bytes()
+        score = message.timestamp.timestamp()
+        
+        try:
+            if self._publish_script_sha is None and self._scripting_available:
+                try:
+                    self._publish_script_sha = await self._pub_client.script_load(_PUBLISH_WITH_HISTORY_LUA)
+                except ResponseError as e:
+                    # Redis refused the script (NOPERM, unknown command); connection errors propagate
+                    self.logger.warning("Cannot load publish script, using pipelines instead: %s", e)
+                    self._scripting_available = False
+            
+            if self._publish_script_sha is not None:
+                try:
+                    return await self._pub_client.evalsha(
+                        self._publish_script_sha, 2, channel, history_key, data, score
+                    )
+                except NoScriptError:
+                    self.logger.warning("Publish script missing from Redis, reloading on next publish")
+                    self._publish_script_sha = None
+            
+            pipe = self._pub_client.pipeline(transaction=False)
+            pipe.publish(channel, data)
+            pipe.zadd(history_key, {data: score})
+            result, _ = await pipe.execute()
+            return result
+        
+        except Exception as e:
+            self.logger.error("Failed to publish message with history to %s: %s", channel, e)
+            raise
+    
+    def publish_nowait(self, channel: str, message: Message) -> None:
+        """
+        Queue a message for publishing without waiting for Redis to acknowledge it
+        
+        The message is still pipelined with other publishes, but the subscriber
+        count is discarded and delivery errors are only logged. Raises
+        asyncio.QueueFull if the outbound queue is full; send_message waits
+        for space instead.
+        
+        Args:
+            channel: Channel name to publish to
+            message: Message to publish
+        """
+        if not self.redis_client or not self._publish_queue:
+            raise RuntimeError("Message bus not connected")
+        
+        self._publish_queue.put_nowait((channel, message.to_bytes(), None))
+    
+    async def _flush_publishes(self) -> None:
+        """Drain queued publishes and send each batch as a single pipeline"""
+        queue = self._publish_queue
+        batch_size = settings.redis_batch_size
+        flush_interval = settings.redis_flush_interval_ms / 1000
+        
+        while True:
+            batch = []
+            try:
+                batch.append(await queue.get())
+                
+                # Give concurrent publishers a brief window to join a partial batch
+                if flush_interval > 0 and queue.qsize() < batch_size - 1:
+                    await asyncio.sleep(flush_interval)
+                
+                while len(batch) < batch_size and not queue.empty():
+                    batch.append(queue.get_nowait())
+                
+                pipe = self._pub_client.pipeline(transaction=False)
+                for channel, data, _ in batch:
+                    pipe.publish(channel, data)
+                
+                results = await pipe.execute()
+            except asyncio.CancelledError:
+                # Items already taken off the queue are invisible to disconnect(), so fail them here
+                for _, _, future in batch:
+                    if future and not future.done():
+                        future.set_exception(RuntimeError("Message bus disconnected"))
+                raise
+            except Exception as e:
+                self.logger.error("Failed to flush %d published messages: %s", len(batch), e)
+                for _, _, future in batch:
+                    if future and not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, _, future), result in zip(batch, results):
+                if future and not future.done():
+                    future.set_result(result)
+    
     async def subscribe(self, channel: str, handler_id: str) -> None:
         """
         Subscribe a handler to a channel
@@ -143,11 +546,16 @@ class MessageBus:
         
         if handler_id not in self.subscriptions[channel]:
             self.subscriptions[channel].append(handler_id)
+            self._start_handler_workers(handler_id)
             
-            # Start listener if this is the first subscription to this channel
+            # Subscribe the shared pubsub connection on the first handler for this channel
             if len(self.subscriptions[channel]) == 1:
-                task = asyncio.create_task(self._listen_to_channel(channel))
-                self.listener_tasks.append(task)
+                if not self._pubsub:
+                    raise RuntimeError("Message bus not connected")
+                await self._pubsub.subscribe(channel)
+                
+                if self._listener_task is None:
+                    self._listener_task = asyncio.create_task(self._listen())
             
             self.logger.info(f"Handler {handler_id} subscribed to channel {channel}")
     
@@ -162,17 +570,24 @@ class MessageBus:
         if channel in self.subscriptions and handler_id in self.subscriptions[channel]:
             self.subscriptions[channel].remove(handler_id)
             
-            # If no more handlers for this channel, stop the listener
+            # If no more handlers for this channel, drop it from the shared connection
             if not self.subscriptions[channel]:
                 del self.subscriptions[channel]
-                # Cancel corresponding listener task
-                for task in self.listener_tasks:
-                    if not task.done() and channel in str(task):
-                        task.cancel()
-                        break
+                if self._pubsub:
+                    await self._pubsub.unsubscribe(channel)
             
             self.logger.info(f"Handler {handler_id} unsubscribed from channel {channel}")
     
+    async def _unsubscribe_all(self, channels: Iterable[str], handler_id: str) -> None:
+        """Unsubscribe a handler from several channels"""
+        results = await asyncio.gather(
+            *(self.unsubscribe(channel, handler_id) for channel in channels),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error("Failed to unsubscribe handler %s: %s", handler_id, result)
+    
     def register_handler(self, handler: MessageHandler) -> None:
         """Register a message handler"""
         self.handlers[handler.handler_id] = handler
@@ -187,58 +602,95 @@ class MessageBus:
                 if handler_id in handler_ids:
                     channels_to_remove.append(channel)
             
-            for channel in channels_to_remove:
-                asyncio.create_task(self.unsubscribe(channel, handler_id))
+            if channels_to_remove:
+                # One cleanup task for all channels instead of a task per channel
+                task = asyncio.create_task(self._unsubscribe_all(channels_to_remove, handler_id))
+                self._cleanup_tasks.add(task)
+                task.add_done_callback(self._cleanup_tasks.discard)
+            
+            for task in self._handler_workers.pop(handler_id, []):
+                task.cancel()
+            self._handler_queues.pop(handler_id, None)
             
             del self.handlers[handler_id]
             self.logger.info(f"Unregistered message handler {handler_id}")
     
-    async def _listen_to_channel(self, channel: str) -> None:
-        """Listen to a specific channel and dispatch messages to handlers"""
-        if not self.redis_client:
-            return
+    async def _listen(self) -> None:
+        """Read messages for all subscribed channels and dispatch them to handlers"""
+        self.logger.info("Started message bus listener")
         
         try:
-            pubsub = self.redis_client.pubsub()
-            await pubsub.subscribe(channel)
-            
-            self.logger.info(f"Started listening to channel {channel}")
-            
-            async for message in pubsub.listen():
-                if message['type'] == 'message':
-                    try:
-                        # Parse message
-                        msg_data = json.loads(message['data'])
-                        msg = Message(**msg_data)
-                        
-                        # Dispatch to all subscribed handlers
-                        if channel in self.subscriptions:
-                            tasks = []
-                            for handler_id in self.subscriptions[channel]:
-                                if handler_id in self.handlers:
-                                    handler = self.handlers[handler_id]
-                                    tasks.append(
-                                        asyncio.create_task(
-                                            self._handle_message_safely(handler, msg)
-                                        )
-                                    )
-                            
-                            if tasks:
-                                await asyncio.gather(*tasks, return_exceptions=True)
+            while self.running:
+                message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message is None or message['type'] != 'message':
+                    continue
+                
+                channel = message['channel'].decode()
+                try:
+                    # Parse message
+                    msg = Message.from_bytes(message['data'], self.trusted_senders)
                     
-                    except Exception as e:
-                        self.logger.error(f"Error processing message from {channel}: {e}")
+                    # Stale traffic never reaches the handler queues
+                    if msg.expires_at is not None and msg.expires_at.timestamp() < time.time():
+                        self.expired_messages += 1
+                        continue
+                    
+                    # Hand off to each subscribed handler's queue without waiting on it
+                    item = (msg.priority, next(self._dispatch_seq), msg)
+                    for handler_id in self.subscriptions.get(channel, ()):
+                        queue = self._handler_queues.get(handler_id)
+                        if queue is None:
+                            continue
+                        dropped = queue.put_evicting(item)
+                        if dropped is not None:
+                            self.dropped_messages += 1
+                            self.logger.warning(
+                                "Handler %s queue full, dropped message %s", handler_id, dropped[2].id
+                            )
+                
+                except Exception as e:
+                    self.logger.error("Error processing message from %s: %s", channel, e)
         
         except asyncio.CancelledError:
-            self.logger.info(f"Channel listener for {channel} cancelled")
+            self.logger.info("Message bus listener cancelled")
         except Exception as e:
-            self.logger.error(f"Error in channel listener for {channel}: {e}")
+            self.logger.error("Error in message bus listener: %s", e)
         finally:
-            try:
-                await pubsub.unsubscribe(channel)
-                await pubsub.close()
-            except:
-                pass
+            self._listener_task = None
+    
+    def _start_handler_workers(self, handler_id: str) -> None:
+        """Create the handler's queue and worker tasks if they are not running yet"""
+        if handler_id in self._handler_workers:
+            return
+        
+        handler = self.handlers[handler_id]
+        queue = _HandlerQueue(maxsize=settings.message_handler_queue_size)
+        self._handler_queues[handler_id] = queue
+        self._handler_workers[handler_id] = [
+            asyncio.create_task(self._handler_worker(handler, queue))
+            for _ in range(max(1, settings.message_handler_workers))
+        ]
+    
+    async def _stop_handler_workers(self, handler_id: str) -> None:
+        """Cancel a handler's worker tasks and drop its queue"""
+        workers = self._handler_workers.pop(handler_id, [])
+        self._handler_queues.pop(handler_id, None)
+        for task in workers:
+            task.cancel()
+        if workers:
+            await asyncio.gather(*workers, return_exceptions=True)
+    
+    async def _handler_worker(self, handler: MessageHandler, queue: _HandlerQueue) -> None:
+        """Feed queued messages to a handler one at a time, highest priority first"""
+        while True:
+            _, _, message = await queue.get()
+            
+            # Messages can also expire while waiting in the queue
+            if message.expires_at is not None and message.expires_at.timestamp() < time.time():
+                self.expired_messages += 1
+                continue
+            
+            await self._handle_message_safely(handler, message)
     
     async def _handle_message_safely(self, handler: MessageHandler, message: Message) -> None:
         """Safely handle a message with error handling"""
@@ -247,12 +699,12 @@ class MessageBus:
             
             # If handler returns a response, publish it
             if response and message.sender_id:
-                response_channel = f"agent_{message.sender_id}_responses"
+                response_channel = _agent_responses_channel(message.sender_id)
                 await self.publish(response_channel, response)
         
         except Exception as e:
             self.logger.error(
-                f"Handler {handler.handler_id} failed to process message {message.id}: {e}"
+                "Handler %s failed to process message %s: %s", handler.handler_id, message.id, e
             )
     
     async def send_message(
@@ -262,7 +714,8 @@ class MessageBus:
         message_type: MessageType,
         payload: Dict[str, Any],
         correlation_id: Optional[str] = None,
-        priority: int = 5
+        priority: int = 5,
+        confirm: bool = False
     ) -> str:
         """
         Send a message to a specific agent or broadcast
@@ -274,6 +727,7 @@ class MessageBus:
             payload: Message payload
             correlation_id: Optional correlation ID for request/response
             priority: Message priority (1=highest, 10=lowest)
+            confirm: Wait for Redis to acknowledge the publish before returning
             
         Returns:
             str: Message ID
@@ -289,11 +743,16 @@ class MessageBus:
         
         # Determine channel
         if recipient_id:
-            channel = f"agent_{recipient_id}"
+            channel = _agent_channel(recipient_id)
         else:
             channel = "broadcast"
         
-        await self.publish(channel, message)
+        if confirm:
+            await self.publish(channel, message)
+        elif not self._publish_queue:
+            raise RuntimeError("Message bus not connected")
+        else:
+            await self._publish_queue.put((channel, message.to_bytes(), None))
         return message.id
     
     async def request_response(
@@ -317,14 +776,18 @@ class MessageBus:
         Returns:
             Optional[Message]: Response message or None if timeout
         """
-        correlation_id = f"req_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        correlation_id = f"req_{time.time_ns()}_{next(_ID_COUNTER)}"
         
-        # Subscribe to response channel temporarily
-        response_channel = f"agent_{sender_id}_responses"
-        response_handler = ResponseHandler(correlation_id)
+        # Route the sender's response channel through the shared handler (once per sender)
+        response_channel = _agent_responses_channel(sender_id)
+        router_id = self._response_router.handler_id
+        if router_id not in self.handlers:
+            self.register_handler(self._response_router)
+        if router_id not in self.subscriptions.get(response_channel, ()):
+            await self.subscribe(response_channel, router_id)
         
-        self.register_handler(response_handler)
-        await self.subscribe(response_channel, response_handler.handler_id)
+        future = asyncio.get_running_loop().create_future()
+        self._pending_responses[correlation_id] = future
         
         try:
             # Send request
@@ -333,16 +796,12 @@ class MessageBus:
                 recipient_id=recipient_id,
                 message_type=message_type,
                 payload=payload,
-                correlation_id=correlation_id
+                correlation_id=correlation_id,
+                confirm=True
             )
             
             # Wait for response
-            response = await asyncio.wait_for(
-                response_handler.wait_for_response(),
-                timeout=timeout
-            )
-            
-            return response
+            return await asyncio.wait_for(future, timeout=timeout)
         
         except asyncio.TimeoutError:
             self.logger.warning(
@@ -351,31 +810,23 @@ class MessageBus:
             return None
         
         finally:
-            # Cleanup
-            await self.unsubscribe(response_channel, response_handler.handler_id)
-            self.unregister_handler(response_handler.handler_id)
+            self._pending_responses.pop(correlation_id, None)
 
 
-class ResponseHandler(MessageHandler):
-    """Special handler for waiting for responses"""
+class _ResponseRouter(MessageHandler):
+    """Shared handler that resolves pending request_response futures by correlation_id"""
+    __slots__ = ('_pending',)
     
-    def __init__(self, correlation_id: str):
-        super().__init__(f"response_handler_{correlation_id}")
-        self.correlation_id = correlation_id
-        self.response_event = asyncio.Event()
-        self.response: Optional[Message] = None
+    def __init__(self, pending: Dict[str, asyncio.Future]):
+        super().__init__("response_router")
+        self._pending = pending
     
     async def handle_message(self, message: Message) -> Optional[Message]:
-        """Handle response message"""
-        if message.correlation_id == self.correlation_id:
-            self.response = message
-            self.response_event.set()
+        """Deliver a response to the request waiting on its correlation_id"""
+        future = self._pending.pop(message.correlation_id, None)
+        if future and not future.done():
+            future.set_result(message)
         return None
-    
-    async def wait_for_response(self) -> Optional[Message]:
-        """Wait for the response"""
-        await self.response_event.wait()
-        return self.response
 
 
 # Global message bus instance
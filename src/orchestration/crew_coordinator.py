@@ -6,10 +6,17 @@ using CrewAI's Crew functionality to orchestrate complex development workflows.
 """
 
 import asyncio
+import contextvars
+import heapq
+import itertools
 import logging
-from typing import Dict, List, Any, Optional, Union
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, Final, List, Any, Optional, Set, Tuple, Union
 from datetime import datetime
 from enum import Enum
+from types import MappingProxyType
 
 from crewai import Crew, Task, Process
 from pydantic import BaseModel, Field
@@ -21,6 +28,81 @@ from ..core.base_agent import TaskResult
 from ..core.message_bus import message_bus, MessageType
 
 
+logger = logging.getLogger("crew_coordinator")
+
+
+# Task text shared by every workflow run; templates are filled with str.format_map
+_DEV_EXPECTED: Final[str] = "Complete implementation with code and documentation"
+_CODE_REVIEW_DESC_TEMPLATE: Final[str] = "Review the following code for quality, security, and best practices:\n\n{code}"
+_CODE_REVIEW_EXPECTED: Final[str] = "Comprehensive code review with issues and recommendations"
+
+_FULL_DEV_EXPECTED: Final[str] = "Complete implementation with code, tests, and documentation"
+_FULL_DEV_REVIEW_DESC: Final[str] = (
+    "Review the developed code for quality, security, and best practices. "
+    "Provide detailed feedback and suggestions for improvement."
+)
+_FULL_DEV_REVIEW_EXPECTED: Final[str] = "Comprehensive code review with quality score and recommendations"
+
+_ARCH_DESC_TEMPLATE: Final[str] = (
+    "Design a comprehensive software architecture for: {description}. "
+    "Consider scalability, maintainability, security, and performance. "
+    "Include component diagrams, API design, and technology recommendations."
+)
+_ARCH_EXPECTED: Final[str] = "Detailed architecture document with diagrams, component specifications, and implementation guide"
+_ARCH_REVIEW_DESC: Final[str] = (
+    "Review the proposed architecture for potential issues, scalability concerns, "
+    "security vulnerabilities, and adherence to best practices. Provide recommendations."
+)
+_ARCH_REVIEW_EXPECTED: Final[str] = "Architecture review with assessment and improvement recommendations"
+
+_BUG_FIX_DESC_TEMPLATE: Final[str] = (
+    "Analyze and fix the following bug: {bug_description}\n\n"
+    "Code context: {code}\n\n"
+    "Provide a detailed analysis of the bug, root cause, and implement a fix. "
+    "Include test cases to prevent regression."
+)
+_BUG_FIX_EXPECTED: Final[str] = "Bug analysis, fix implementation, and test cases"
+_BUG_FIX_REVIEW_DESC: Final[str] = (
+    "Review the bug fix to ensure it properly addresses the issue without "
+    "introducing new problems. Verify the test cases are comprehensive."
+)
+_BUG_FIX_REVIEW_EXPECTED: Final[str] = "Bug fix verification with quality assessment"
+
+_REFACTOR_DESC_TEMPLATE: Final[str] = (
+    "Refactor the following code to improve: {goals}.\n\n"
+    "Original code:\n{code}\n\n"
+    "Goals: {description}\n\n"
+    "Maintain functionality while improving code quality, readability, and maintainability."
+)
+_REFACTOR_EXPECTED: Final[str] = "Refactored code with explanations of changes and improvements"
+_REFACTOR_REVIEW_DESC: Final[str] = (
+    "Review the refactored code to ensure improvements were made without "
+    "breaking functionality. Verify that refactoring goals were achieved."
+)
+_REFACTOR_REVIEW_EXPECTED: Final[str] = "Refactoring quality assessment with recommendations"
+
+# Fixed keys of each workflow's result dict; handlers merge in their dynamic fields
+_SIMPLE_DEV_TEMPLATE: Final = MappingProxyType({
+    "workflow_type": "simple_development",
+    "agent_used": "developer",
+    "status": "completed"
+})
+_CODE_REVIEW_TEMPLATE: Final = MappingProxyType({
+    "workflow_type": "code_review",
+    "agent_used": "reviewer",
+    "status": "completed"
+})
+_FULL_DEV_TEMPLATE: Final = MappingProxyType({
+    "workflow_type": "full_development_cycle",
+    "development_phase": "completed",
+    "review_phase": "completed",
+    "status": "completed"
+})
+_ARCH_TEMPLATE: Final = MappingProxyType({"workflow_type": "architecture_design", "status": "completed"})
+_BUG_FIX_TEMPLATE: Final = MappingProxyType({"workflow_type": "bug_fix", "status": "completed"})
+_REFACTOR_TEMPLATE: Final = MappingProxyType({"workflow_type": "refactoring", "status": "completed"})
+
+
 class WorkflowType(str, Enum):
     """Types of development workflows"""
     SIMPLE_DEVELOPMENT = "simple_development"
@@ -64,6 +146,17 @@ class WorkflowResult(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
+class _TaskSpec:
+    """A workflow task that names its agent; bound to a crew's own agents at kickoff"""
+    __slots__ = ('description', 'agent', 'expected_output', 'context')
+    
+    def __init__(self, description: str, agent: str, expected_output: str, context: Optional[List["_TaskSpec"]] = None):
+        self.description = description
+        self.agent = agent
+        self.expected_output = expected_output
+        self.context = context
+
+
 class CrewCoordinator:
     """
     Main coordinator for multi-agent workflows using CrewAI
@@ -73,23 +166,300 @@ class CrewCoordinator:
     """
     
     def __init__(self):
-        self.logger = logging.getLogger("crew_coordinator")
-        self.active_workflows: Dict[str, WorkflowResult] = {}
+        # Workflows in least- to most-recently-used order; finished ones are evicted past _max_history
+        self.active_workflows: OrderedDict[str, WorkflowResult] = OrderedDict()
+        self._max_history = 1000
+        
+        # Workflow ids are "wf_<coordinator start ns>_<sequence>": unique without reading the clock per request
+        self._start_epoch = time.time_ns()
+        self._id_counter = itertools.count()
+        
+        # Ids of running workflows, which are never evicted
+        self._running_ids: Set[str] = set()
+        
+        # Agents are built on first use, so a process only pays for the agents its workflows need
         self.agents: Dict[str, Any] = {}
-        self.crews: Dict[str, Crew] = {}
+        self._agent_factories: Dict[str, Callable[..., Any]] = {
+            "developer": DeveloperAgent,
+            "reviewer": ReviewerAgent,
+        }
+        # Roles whose agent's own crew_agent has been handed to a crew already
+        self._claimed_crew_agents: Set[str] = set()
+        
+        # Idle crews per (workflow type, agent names); a kickoff checks one out exclusively
+        self.crews: Dict[Tuple[WorkflowType, Tuple[str, ...]], List[Crew]] = {}
+        
+        # Blocking crew.kickoff() calls run here so workflows don't stall the event loop
+        self._kickoff_executor = ThreadPoolExecutor(
+            max_workers=settings.max_concurrent_workflows,
+            thread_name_prefix="crew_kickoff"
+        )
+        
+        # Workflow type -> handler, resolved once instead of per request
+        self._handlers: Dict[WorkflowType, Callable[[str, WorkflowRequest], Awaitable[Dict[str, Any]]]] = {
+            WorkflowType.SIMPLE_DEVELOPMENT: self._execute_simple_development,
+            WorkflowType.CODE_REVIEW_WORKFLOW: self._execute_code_review_workflow,
+            WorkflowType.FULL_DEVELOPMENT_CYCLE: self._execute_full_development_cycle,
+            WorkflowType.ARCHITECTURE_DESIGN: self._execute_architecture_design,
+            WorkflowType.BUG_FIX_WORKFLOW: self._execute_bug_fix_workflow,
+            WorkflowType.REFACTORING_WORKFLOW: self._execute_refactoring_workflow,
+        }
+        
+        # Submitted workflows waiting for a slot, ordered by (-priority, arrival, seq).
+        # The dispatcher task is created on first submit, inside the loop.
+        self._pending: List[Tuple[int, float, int, WorkflowRequest, asyncio.Future]] = []
+        self._pending_seq = itertools.count()
+        self._pending_ready: Optional[asyncio.Event] = None
+        self._dispatcher_task: Optional[asyncio.Task] = None
+        self._dispatched_tasks: Set[asyncio.Task] = set()
+        
+        # Bounds running workflows across execute_workflow(s) and the dispatcher; created lazily
+        self._workflow_slots: Optional[asyncio.Semaphore] = None
+    
+    @classmethod
+    def configure_loop(cls) -> None:
+        """
+        Install asyncio's eager task factory on the running loop where available
+        
+        Eager tasks run synchronously until their first real suspension, which
+        makes the many short coordinator coroutines cheaper. Python < 3.12 has
+        no eager task factory, so this is a no-op there.
+        """
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_task_factory is not None:
+            asyncio.get_running_loop().set_task_factory(eager_task_factory)
+    
+    def _agent(self, name: str) -> Any:
+        """Return the named agent, constructing it on first use"""
+        agent = self.agents.get(name)
+        if agent is None:
+            try:
+                agent = self._agent_factories[name](agent_id=f"crew_{name}_001")
+            except Exception as e:
+                logger.error("Failed to initialize %s agent: %s", name, e)
+                raise
+            self.agents[name] = agent
+            logger.info("Agent %s initialized", name)
+        return agent
+    
+    def _acquire_crew(self, workflow_type: WorkflowType, agent_names: Tuple[str, ...], specs: List[_TaskSpec]) -> Crew:
+        """
+        Check out an idle crew for this workflow type and agent set, loaded with ``specs``
+        
+        An idle crew is reused if there is one; otherwise another is built, so
+        same-type workflows never wait on each other. Each crew gets its own
+        CrewAI agents: kickoff() mutates agent state (agent.crew, the task
+        executor), so agents must never be shared by crews that can run on
+        different threads at the same time.
+        """
+        idle = self.crews.get((workflow_type, tuple(sorted(agent_names))))
+        
+        if idle:
+            crew = idle.pop()
+            crew.tasks = self._bind_tasks(specs, dict(zip(agent_names, crew.agents)))
+            return crew
+        
+        crew_agents = [self._new_crew_agent(name) for name in agent_names]
+        crew = Crew(
+            agents=crew_agents,
+            tasks=self._bind_tasks(specs, dict(zip(agent_names, crew_agents))),
+            process=Process.sequential,
+            verbose=settings.debug
+        )
+        self._memoize_knowledge(crew)
+        return crew
+    
+    def _new_crew_agent(self, name: str) -> Any:
+        """
+        Return a CrewAI agent for a new crew
+        
+        The first crew for a role takes the agent's own crew_agent, built in
+        its constructor, so it is not wasted; later crews get fresh ones.
+        """
+        agent = self._agent(name)
+        if name not in self._claimed_crew_agents:
+            self._claimed_crew_agents.add(name)
+            return agent.crew_agent
+        return agent._create_crew_agent()
+    
+    def _release_crew(self, key: Tuple[WorkflowType, Tuple[str, ...]], crew: Crew) -> None:
+        """Return a crew to its idle pool, keeping at most one per workflow slot"""
+        idle = self.crews.setdefault(key, [])
+        if len(idle) < settings.max_concurrent_workflows:
+            idle.append(crew)
+    
+    @staticmethod
+    def _bind_tasks(specs: List[_TaskSpec], crew_agents: Dict[str, Any]) -> List[Task]:
+        """Build CrewAI tasks from specs, assigned to the given crew's agents"""
+        tasks: Dict[int, Task] = {}
+        for spec in specs:
+            task_kwargs = {
+                "description": spec.description,
+                "agent": crew_agents[spec.agent],
+                "expected_output": spec.expected_output,
+            }
+            if spec.context:
+                task_kwargs["context"] = [tasks[id(dependency)] for dependency in spec.context]
+            tasks[id(spec)] = Task(**task_kwargs)
+        return list(tasks.values())
+    
+    @staticmethod
+    def _memoize_knowledge(crew: Crew) -> None:
+        """
+        Make each agent's knowledge setup run only on its first kickoff
         
-        # Initialize agents
-        self._initialize_agents()
+        crew.kickoff() calls agent.set_knowledge() for every agent on every run,
+        re-registering embedders and reloading knowledge sources. Our agents and
+        crews live for the whole process, so the first load is kept and later
+        calls become no-ops.
+        """
+        if getattr(crew, "_knowledge_loaded", False):
+            return
+        
+        for agent in crew.agents:
+            set_knowledge = getattr(agent, "set_knowledge", None)
+            if set_knowledge is None or getattr(agent, "_knowledge_memoized", False):
+                continue
+            
+            def set_knowledge_once(*args, _agent=agent, _original=set_knowledge, **kwargs):
+                if getattr(_agent, "_knowledge_loaded", False):
+                    return None
+                result = _original(*args, **kwargs)
+                object.__setattr__(_agent, "_knowledge_loaded", True)
+                return result
+            
+            # Agents are pydantic models; bypass field validation to shadow the bound method
+            object.__setattr__(agent, "set_knowledge", set_knowledge_once)
+            object.__setattr__(agent, "_knowledge_memoized", True)
+        
+        object.__setattr__(crew, "_knowledge_loaded", True)
     
-    def _initialize_agents(self):
-        """Initialize all available agents"""
+    @staticmethod
+    def _mock_kickoff(specs: List[_TaskSpec]) -> str:
+        """
+        Stand-in kickoff result used when LLM responses are mocked
+        
+        Mock agents are not CrewAI agents and cannot be put in a Task or Crew,
+        so no crew is built; each task reports what it would have produced.
+        """
+        return "\n\n".join(
+            f"[mock {spec.agent}] {spec.expected_output}" for spec in specs
+        )
+    
+    async def _run_kickoff(self, crew: Crew, key: Tuple[WorkflowType, Tuple[str, ...]]) -> Any:
+        """
+        Run crew.kickoff() on the kickoff thread pool, propagating context vars if any are set
+        
+        The crew goes back to its pool when the thread finishes with it, which
+        may be after this coroutine has been cancelled.
+        """
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        if not ctx:
+            future = self._kickoff_executor.submit(crew.kickoff)
+        else:
+            future = self._kickoff_executor.submit(ctx.run, crew.kickoff)
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release_crew, key, crew))
+        return await asyncio.wrap_future(future)
+    
+    async def _kickoff_workflow(self, workflow_type: WorkflowType, agent_names: Tuple[str, ...], tasks: List[_TaskSpec]) -> Any:
+        """Run ``tasks`` on an idle crew for this workflow type off the event loop"""
+        if settings.mock_llm_responses:
+            return self._mock_kickoff(tasks)
+        
+        crew = self._acquire_crew(workflow_type, agent_names, tasks)
+        return await self._run_kickoff(crew, (workflow_type, tuple(sorted(agent_names))))
+    
+    def submit_workflow(self, request: WorkflowRequest) -> "asyncio.Future[WorkflowResult]":
+        """
+        Queue a workflow for execution in priority order
+        
+        Higher ``request.priority`` runs first; equal priorities run in arrival
+        order. At most ``settings.max_concurrent_workflows`` submitted workflows
+        run at once.
+        
+        Args:
+            request: Workflow request with type and parameters
+            
+        Returns:
+            asyncio.Future: Resolves to the WorkflowResult once the workflow finishes
+        """
+        loop = asyncio.get_running_loop()
+        if self._dispatcher_task is None or self._dispatcher_task.done():
+            self._pending_ready = asyncio.Event()
+            self._dispatcher_task = loop.create_task(self._dispatcher())
+        
+        future = loop.create_future()
+        heapq.heappush(
+            self._pending,
+            (-request.priority, time.monotonic(), next(self._pending_seq), request, future)
+        )
+        self._pending_ready.set()
+        return future
+    
+    async def _dispatcher(self):
+        """Start the highest-priority pending workflow whenever a slot frees up"""
+        while True:
+            if not self._pending:
+                self._pending_ready.clear()
+                await self._pending_ready.wait()
+                continue
+            
+            # Wait for a slot before popping so the pick reflects the latest submissions
+            slots = self._get_workflow_slots()
+            await slots.acquire()
+            if not self._pending:
+                slots.release()
+                continue
+            
+            _, _, _, request, future = heapq.heappop(self._pending)
+            if future.cancelled():
+                slots.release()
+                continue
+            
+            # Hold a reference so the running workflow task is not garbage-collected
+            task = asyncio.create_task(self._run_submitted(request, future))
+            self._dispatched_tasks.add(task)
+            task.add_done_callback(self._dispatched_tasks.discard)
+    
+    async def _run_submitted(self, request: WorkflowRequest, future: asyncio.Future):
+        """Run one dequeued workflow and resolve its future; the caller holds a slot"""
         try:
-            self.agents["developer"] = DeveloperAgent(agent_id="crew_developer_001")
-            self.agents["reviewer"] = ReviewerAgent(agent_id="crew_reviewer_001")
-            self.logger.info("Agents initialized successfully")
-        except Exception as e:
-            self.logger.error(f"Failed to initialize agents: {e}")
+            result = await self._run_workflow(request)
+            if not future.done():
+                future.set_result(result)
+        except asyncio.CancelledError:
+            future.cancel()
             raise
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        finally:
+            self._workflow_slots.release()
+    
+    def _get_workflow_slots(self) -> asyncio.Semaphore:
+        """Return the workflow concurrency semaphore, creating it inside the running loop"""
+        if self._workflow_slots is None:
+            self._workflow_slots = asyncio.Semaphore(settings.max_concurrent_workflows)
+        return self._workflow_slots
+    
+    async def execute_workflows(self, requests: List[WorkflowRequest]) -> List[Union[WorkflowResult, BaseException]]:
+        """
+        Execute independent workflows concurrently
+        
+        At most ``settings.max_concurrent_workflows`` run at once; the rest wait
+        for a slot.
+        
+        Args:
+            requests: Workflow requests to execute
+            
+        Returns:
+            List of WorkflowResult (or the raised exception) in request order
+        """
+        return await asyncio.gather(
+            *(self.execute_workflow(request) for request in requests),
+            return_exceptions=True
+        )
     
     async def execute_workflow(self, request: WorkflowRequest) -> WorkflowResult:
         """
@@ -101,7 +471,12 @@ class CrewCoordinator:
         Returns:
             WorkflowResult: Result of workflow execution
         """
-        workflow_id = f"workflow_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        async with self._get_workflow_slots():
+            return await self._run_workflow(request)
+    
+    async def _run_workflow(self, request: WorkflowRequest) -> WorkflowResult:
+        """Execute a workflow without taking a concurrency slot"""
+        workflow_id = f"wf_{self._start_epoch}_{next(self._id_counter)}"
         
         # Initialize workflow result
         workflow_result = WorkflowResult(
@@ -112,25 +487,20 @@ class CrewCoordinator:
         )
         
         self.active_workflows[workflow_id] = workflow_result
+        if len(self.active_workflows) > self._max_history:
+            self._evict_finished(self._max_history)
         
         try:
-            self.logger.info(f"Starting workflow {workflow_id}: {request.workflow_type}")
+            logger.info("Starting workflow %s: %s", workflow_id, request.workflow_type.value)
+            
+            workflow_result.status = WorkflowStatus.RUNNING
+            self._running_ids.add(workflow_id)
             
             # Route to appropriate workflow handler
-            if request.workflow_type == WorkflowType.SIMPLE_DEVELOPMENT:
-                result = await self._execute_simple_development(workflow_id, request)
-            elif request.workflow_type == WorkflowType.CODE_REVIEW_WORKFLOW:
-                result = await self._execute_code_review_workflow(workflow_id, request)
-            elif request.workflow_type == WorkflowType.FULL_DEVELOPMENT_CYCLE:
-                result = await self._execute_full_development_cycle(workflow_id, request)
-            elif request.workflow_type == WorkflowType.ARCHITECTURE_DESIGN:
-                result = await self._execute_architecture_design(workflow_id, request)
-            elif request.workflow_type == WorkflowType.BUG_FIX_WORKFLOW:
-                result = await self._execute_bug_fix_workflow(workflow_id, request)
-            elif request.workflow_type == WorkflowType.REFACTORING_WORKFLOW:
-                result = await self._execute_refactoring_workflow(workflow_id, request)
-            else:
+            handler = self._handlers.get(request.workflow_type)
+            if handler is None:
                 raise ValueError(f"Unknown workflow type: {request.workflow_type}")
+            result = await handler(workflow_id, request)
             
             # Update workflow result
             workflow_result.status = WorkflowStatus.COMPLETED
@@ -138,7 +508,7 @@ class CrewCoordinator:
             workflow_result.completed_at = datetime.now()
             workflow_result.execution_time = (workflow_result.completed_at - workflow_result.started_at).total_seconds()
             
-            self.logger.info(f"Workflow {workflow_id} completed successfully")
+            logger.info("Workflow %s completed successfully", workflow_id)
             
         except Exception as e:
             workflow_result.status = WorkflowStatus.FAILED
@@ -146,42 +516,77 @@ class CrewCoordinator:
             workflow_result.completed_at = datetime.now()
             workflow_result.execution_time = (workflow_result.completed_at - workflow_result.started_at).total_seconds()
             
-            self.logger.error(f"Workflow {workflow_id} failed: {e}")
+            logger.error("Workflow %s failed: %s", workflow_id, e)
+        
+        finally:
+            # Cancellation (client disconnect, timeout) skips both branches above
+            if workflow_result.status == WorkflowStatus.RUNNING:
+                workflow_result.status = WorkflowStatus.CANCELLED
+                workflow_result.completed_at = datetime.now()
+                workflow_result.execution_time = (workflow_result.completed_at - workflow_result.started_at).total_seconds()
+                logger.info("Workflow %s cancelled", workflow_id)
+            self._mark_finished(workflow_result)
         
         return workflow_result
     
+    def _mark_finished(self, workflow: WorkflowResult) -> None:
+        """Drop a workflow from the running set, making it eligible for eviction"""
+        self._running_ids.discard(workflow.workflow_id)
+    
+    def _evict_finished(self, limit: int) -> int:
+        """Evict least recently used finished workflows until at most ``limit`` remain"""
+        excess = len(self.active_workflows) - limit
+        if excess <= 0:
+            return 0
+        
+        stale = []
+        for workflow_id in self.active_workflows:
+            if len(stale) >= excess:
+                break
+            if workflow_id not in self._running_ids:
+                stale.append(workflow_id)
+        
+        for workflow_id in stale:
+            del self.active_workflows[workflow_id]
+        return len(stale)
+    
+    @staticmethod
+    def _result_text(crew_result: Any) -> str:
+        """
+        Return the final text of a kickoff result
+        
+        Prefers CrewOutput.raw, which is the last task's output as-is, over
+        str(), which may re-render structured output.
+        """
+        raw = getattr(crew_result, "raw", None)
+        if isinstance(raw, str):
+            return raw
+        return str(crew_result)
+    
     async def _execute_simple_development(self, workflow_id: str, request: WorkflowRequest) -> Dict[str, Any]:
         """Execute simple development workflow (single agent)"""
-        self.logger.info(f"Executing simple development workflow: {workflow_id}")
+        logger.info("Executing simple development workflow: %s", workflow_id)
         
         # Create CrewAI task
-        development_task = Task(
+        development_task = _TaskSpec(
             description=request.description,
-            agent=self.agents["developer"].crew_agent,
-            expected_output="Complete implementation with code and documentation"
+            agent="developer",
+            expected_output=_DEV_EXPECTED
         )
         
-        # Create and execute crew
-        crew = Crew(
-            agents=[self.agents["developer"].crew_agent],
-            tasks=[development_task],
-            process=Process.sequential,
-            verbose=settings.debug
+        # Run on a pooled crew for this workflow off the event loop
+        crew_result = await self._kickoff_workflow(
+            WorkflowType.SIMPLE_DEVELOPMENT,
+            ("developer",),
+            [development_task]
         )
         
-        # Execute crew
-        crew_result = crew.kickoff()
-        
-        return {
-            "workflow_type": "simple_development",
-            "development_result": str(crew_result),
-            "agent_used": "developer",
-            "status": "completed"
-        }
+        text = self._result_text(crew_result)
+        return {**_SIMPLE_DEV_TEMPLATE, "development_result": text}
     
     async def _execute_code_review_workflow(self, workflow_id: str, request: WorkflowRequest) -> Dict[str, Any]:
         """Execute code review workflow"""
-        self.logger.info(f"Executing code review workflow: {workflow_id}")
+        logger.info("Executing code review workflow: %s", workflow_id)
         
         # Extract code from context
         code = request.context.get("code")
@@ -189,209 +594,165 @@ class CrewCoordinator:
             raise ValueError("Code must be provided in context for code review workflow")
         
         # Create review task
-        review_task = Task(
-            description=f"Review the following code for quality, security, and best practices:\n\n{code}",
-            agent=self.agents["reviewer"].crew_agent,
-            expected_output="Comprehensive code review with issues and recommendations"
+        review_task = _TaskSpec(
+            description=_CODE_REVIEW_DESC_TEMPLATE.format_map({"code": code}),
+            agent="reviewer",
+            expected_output=_CODE_REVIEW_EXPECTED
         )
         
-        # Create and execute crew
-        crew = Crew(
-            agents=[self.agents["reviewer"].crew_agent],
-            tasks=[review_task],
-            process=Process.sequential,
-            verbose=settings.debug
+        # Run on a pooled crew for this workflow off the event loop
+        crew_result = await self._kickoff_workflow(
+            WorkflowType.CODE_REVIEW_WORKFLOW,
+            ("reviewer",),
+            [review_task]
         )
         
-        crew_result = crew.kickoff()
-        
-        return {
-            "workflow_type": "code_review",
-            "review_result": str(crew_result),
-            "agent_used": "reviewer",
-            "status": "completed"
-        }
+        text = self._result_text(crew_result)
+        return {**_CODE_REVIEW_TEMPLATE, "review_result": text}
     
     async def _execute_full_development_cycle(self, workflow_id: str, request: WorkflowRequest) -> Dict[str, Any]:
         """Execute full development cycle (develop → review → iterate)"""
-        self.logger.info(f"Executing full development cycle: {workflow_id}")
+        logger.info("Executing full development cycle: %s", workflow_id)
         
         # Task 1: Development
-        development_task = Task(
+        development_task = _TaskSpec(
             description=request.description,
-            agent=self.agents["developer"].crew_agent,
-            expected_output="Complete implementation with code, tests, and documentation"
+            agent="developer",
+            expected_output=_FULL_DEV_EXPECTED
         )
         
         # Task 2: Code Review (depends on development)
-        review_task = Task(
-            description="Review the developed code for quality, security, and best practices. Provide detailed feedback and suggestions for improvement.",
-            agent=self.agents["reviewer"].crew_agent,
-            expected_output="Comprehensive code review with quality score and recommendations",
+        review_task = _TaskSpec(
+            description=_FULL_DEV_REVIEW_DESC,
+            agent="reviewer",
+            expected_output=_FULL_DEV_REVIEW_EXPECTED,
             context=[development_task]
         )
         
-        # Create crew with both agents
-        crew = Crew(
-            agents=[
-                self.agents["developer"].crew_agent,
-                self.agents["reviewer"].crew_agent
-            ],
-            tasks=[development_task, review_task],
-            process=Process.sequential,
-            verbose=settings.debug
+        # Run on a pooled crew for this workflow off the event loop
+        crew_result = await self._kickoff_workflow(
+            WorkflowType.FULL_DEVELOPMENT_CYCLE,
+            ("developer", "reviewer"),
+            [development_task, review_task]
         )
         
-        # Execute crew
-        crew_result = crew.kickoff()
-        
+        text = self._result_text(crew_result)
         return {
-            "workflow_type": "full_development_cycle",
-            "development_phase": "completed",
-            "review_phase": "completed",
-            "final_result": str(crew_result),
-            "agents_used": ["developer", "reviewer"],
-            "status": "completed"
+            **_FULL_DEV_TEMPLATE,
+            "final_result": text,
+            "agents_used": ["developer", "reviewer"]
         }
     
     async def _execute_architecture_design(self, workflow_id: str, request: WorkflowRequest) -> Dict[str, Any]:
         """Execute architecture design workflow"""
-        self.logger.info(f"Executing architecture design workflow: {workflow_id}")
+        logger.info("Executing architecture design workflow: %s", workflow_id)
         
         # Architecture design task
-        architecture_task = Task(
-            description=f"Design a comprehensive software architecture for: {request.description}. "
-                       f"Consider scalability, maintainability, security, and performance. "
-                       f"Include component diagrams, API design, and technology recommendations.",
-            agent=self.agents["developer"].crew_agent,
-            expected_output="Detailed architecture document with diagrams, component specifications, and implementation guide"
+        architecture_task = _TaskSpec(
+            description=_ARCH_DESC_TEMPLATE.format_map({"description": request.description}),
+            agent="developer",
+            expected_output=_ARCH_EXPECTED
         )
         
         # Architecture review task
-        review_task = Task(
-            description="Review the proposed architecture for potential issues, scalability concerns, "
-                       "security vulnerabilities, and adherence to best practices. Provide recommendations.",
-            agent=self.agents["reviewer"].crew_agent,
-            expected_output="Architecture review with assessment and improvement recommendations",
+        review_task = _TaskSpec(
+            description=_ARCH_REVIEW_DESC,
+            agent="reviewer",
+            expected_output=_ARCH_REVIEW_EXPECTED,
             context=[architecture_task]
         )
         
-        # Create crew
-        crew = Crew(
-            agents=[
-                self.agents["developer"].crew_agent,
-                self.agents["reviewer"].crew_agent
-            ],
-            tasks=[architecture_task, review_task],
-            process=Process.sequential,
-            verbose=settings.debug
+        # Run on a pooled crew for this workflow off the event loop
+        crew_result = await self._kickoff_workflow(
+            WorkflowType.ARCHITECTURE_DESIGN,
+            ("developer", "reviewer"),
+            [architecture_task, review_task]
         )
         
-        crew_result = crew.kickoff()
-        
-        return {
-            "workflow_type": "architecture_design",
-            "architecture_result": str(crew_result),
-            "status": "completed"
-        }
+        text = self._result_text(crew_result)
+        return {**_ARCH_TEMPLATE, "architecture_result": text}
     
     async def _execute_bug_fix_workflow(self, workflow_id: str, request: WorkflowRequest) -> Dict[str, Any]:
         """Execute bug fix workflow"""
-        self.logger.info(f"Executing bug fix workflow: {workflow_id}")
+        logger.info("Executing bug fix workflow: %s", workflow_id)
         
         bug_description = request.context.get("bug_description", request.description)
         code_with_bug = request.context.get("code", "")
         
         # Bug analysis and fix task
-        fix_task = Task(
-            description=f"Analyze and fix the following bug: {bug_description}\n\n"
-                       f"Code context: {code_with_bug}\n\n"
-                       f"Provide a detailed analysis of the bug, root cause, and implement a fix. "
-                       f"Include test cases to prevent regression.",
-            agent=self.agents["developer"].crew_agent,
-            expected_output="Bug analysis, fix implementation, and test cases"
+        fix_task = _TaskSpec(
+            description=_BUG_FIX_DESC_TEMPLATE.format_map({
+                "bug_description": bug_description,
+                "code": code_with_bug
+            }),
+            agent="developer",
+            expected_output=_BUG_FIX_EXPECTED
         )
         
         # Fix verification task
-        verification_task = Task(
-            description="Review the bug fix to ensure it properly addresses the issue without "
-                       "introducing new problems. Verify the test cases are comprehensive.",
-            agent=self.agents["reviewer"].crew_agent,
-            expected_output="Bug fix verification with quality assessment",
+        verification_task = _TaskSpec(
+            description=_BUG_FIX_REVIEW_DESC,
+            agent="reviewer",
+            expected_output=_BUG_FIX_REVIEW_EXPECTED,
             context=[fix_task]
         )
         
-        # Create crew
-        crew = Crew(
-            agents=[
-                self.agents["developer"].crew_agent,
-                self.agents["reviewer"].crew_agent
-            ],
-            tasks=[fix_task, verification_task],
-            process=Process.sequential,
-            verbose=settings.debug
+        # Run on a pooled crew for this workflow off the event loop
+        crew_result = await self._kickoff_workflow(
+            WorkflowType.BUG_FIX_WORKFLOW,
+            ("developer", "reviewer"),
+            [fix_task, verification_task]
         )
         
-        crew_result = crew.kickoff()
-        
-        return {
-            "workflow_type": "bug_fix",
-            "bug_fix_result": str(crew_result),
-            "status": "completed"
-        }
+        text = self._result_text(crew_result)
+        return {**_BUG_FIX_TEMPLATE, "bug_fix_result": text}
     
     async def _execute_refactoring_workflow(self, workflow_id: str, request: WorkflowRequest) -> Dict[str, Any]:
         """Execute code refactoring workflow"""
-        self.logger.info(f"Executing refactoring workflow: {workflow_id}")
+        logger.info("Executing refactoring workflow: %s", workflow_id)
         
         original_code = request.context.get("code", "")
         refactor_goals = request.context.get("refactor_goals", [])
         
         # Refactoring task
-        refactor_task = Task(
-            description=f"Refactor the following code to improve: {', '.join(refactor_goals)}.\n\n"
-                       f"Original code:\n{original_code}\n\n"
-                       f"Goals: {request.description}\n\n"
-                       f"Maintain functionality while improving code quality, readability, and maintainability.",
-            agent=self.agents["developer"].crew_agent,
-            expected_output="Refactored code with explanations of changes and improvements"
+        refactor_task = _TaskSpec(
+            description=_REFACTOR_DESC_TEMPLATE.format_map({
+                "goals": ", ".join(refactor_goals),
+                "code": original_code,
+                "description": request.description
+            }),
+            agent="developer",
+            expected_output=_REFACTOR_EXPECTED
         )
         
         # Refactoring review task
-        review_task = Task(
-            description="Review the refactored code to ensure improvements were made without "
-                       "breaking functionality. Verify that refactoring goals were achieved.",
-            agent=self.agents["reviewer"].crew_agent,
-            expected_output="Refactoring quality assessment with recommendations",
+        review_task = _TaskSpec(
+            description=_REFACTOR_REVIEW_DESC,
+            agent="reviewer",
+            expected_output=_REFACTOR_REVIEW_EXPECTED,
             context=[refactor_task]
         )
         
-        # Create crew
-        crew = Crew(
-            agents=[
-                self.agents["developer"].crew_agent,
-                self.agents["reviewer"].crew_agent
-            ],
-            tasks=[refactor_task, review_task],
-            process=Process.sequential,
-            verbose=settings.debug
+        # Run on a pooled crew for this workflow off the event loop
+        crew_result = await self._kickoff_workflow(
+            WorkflowType.REFACTORING_WORKFLOW,
+            ("developer", "reviewer"),
+            [refactor_task, review_task]
         )
         
-        crew_result = crew.kickoff()
-        
-        return {
-            "workflow_type": "refactoring",
-            "refactoring_result": str(crew_result),
-            "status": "completed"
-        }
+        text = self._result_text(crew_result)
+        return {**_REFACTOR_TEMPLATE, "refactoring_result": text}
     
     async def get_workflow_status(self, workflow_id: str) -> Optional[WorkflowResult]:
         """Get status of a specific workflow"""
-        return self.active_workflows.get(workflow_id)
+        workflow = self.active_workflows.get(workflow_id)
+        if workflow is not None:
+            self.active_workflows.move_to_end(workflow_id)
+        return workflow
     
     async def list_active_workflows(self) -> List[WorkflowResult]:
         """List all active workflows"""
-        return [w for w in self.active_workflows.values() if w.status == WorkflowStatus.RUNNING]
+        return [self.active_workflows[wid] for wid in self._running_ids]
     
     async def cancel_workflow(self, workflow_id: str) -> bool:
         """Cancel a running workflow"""
@@ -400,27 +761,30 @@ class CrewCoordinator:
             if workflow.status == WorkflowStatus.RUNNING:
                 workflow.status = WorkflowStatus.CANCELLED
                 workflow.completed_at = datetime.now()
-                self.logger.info(f"Workflow {workflow_id} cancelled")
+                self._mark_finished(workflow)
+                logger.info("Workflow %s cancelled", workflow_id)
                 return True
         return False
     
     async def cleanup_completed_workflows(self, max_history: int = 100):
-        """Clean up old completed workflows"""
-        completed_workflows = [
-            (wid, w) for wid, w in self.active_workflows.items() 
-            if w.status in [WorkflowStatus.COMPLETED, WorkflowStatus.FAILED, WorkflowStatus.CANCELLED]
-        ]
-        
-        if len(completed_workflows) > max_history:
-            # Keep only the most recent workflows
-            sorted_workflows = sorted(completed_workflows, key=lambda x: x[1].completed_at or x[1].started_at, reverse=True)
-            to_remove = sorted_workflows[max_history:]
-            
-            for workflow_id, _ in to_remove:
-                del self.active_workflows[workflow_id]
-            
-            self.logger.info(f"Cleaned up {len(to_remove)} old workflows")
+        """
+        Trim finished workflows down to ``max_history``
+        
+        active_workflows is already bounded on insert; this trims further on demand.
+        """
+        removed = self._evict_finished(max_history + len(self._running_ids))
+        
+        if removed:
+            logger.info("Cleaned up %s old workflows", removed)
+
+
+# Global coordinator instance, created on first use rather than at import time
+_coordinator: Optional[CrewCoordinator] = None
 
 
-# Global coordinator instance
-crew_coordinator = CrewCoordinator()
\ No newline at end of file
+def get_coordinator() -> CrewCoordinator:
+    """Return the process-wide CrewCoordinator, creating it on first call"""
+    global _coordinator
+    if _coordinator is None:
+        _coordinator = CrewCoordinator()
+    return _coordinator
@@ -9,6 +9,7 @@ without requiring external dependencies like Redis or PostgreSQL.
 import asyncio
 import sys
 import os
+from collections import defaultdict
 from pathlib import Path
 
 # Add src to Python path
@@ -205,10 +206,24 @@ def test_file_structure():
     ]
     
     missing_files = []
+    base_dir = Path(__file__).parent
     
+    # List each directory once instead of stat-ing every file separately
+    by_dir = defaultdict(set)
     for file_path in required_files:
-        full_path = Path(__file__).parent / file_path
-        if full_path.exists():
+        by_dir[Path(file_path).parent].add(Path(file_path).name)
+    
+    present = {}
+    for directory in by_dir:
+        try:
+            with os.scandir(base_dir / directory) as entries:
+                present[directory] = {entry.name for entry in entries}
+        except OSError:
+            present[directory] = set()
+    
+    for file_path in required_files:
+        path = Path(file_path)
+        if path.name in present[path.parent]:
             print(f"✅ {file_path}")
         else:
             print(f"❌ {file_path} (missing)")
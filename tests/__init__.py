@@ -0,0 +1 @@
+# Tests
\ No newline at end of file
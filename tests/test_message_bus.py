@@ -0,0 +1,152 @@
+"""
+Tests for the message bus handler queues and publish batching
+"""
+
+import asyncio
+
+import pytest
+
+from src.core.message_bus import Message, MessageBus, MessageType, _HandlerQueue
+
+
+class _RecordingPipeline:
+    """Pipeline double that records each executed batch of PUBLISH channels"""
+
+    def __init__(self, client):
+        self._client = client
+        self._commands = []
+
+    def publish(self, channel, data):
+        self._commands.append(channel)
+
+    async def execute(self):
+        self._client.batches.append(list(self._commands))
+        return [1] * len(self._commands)
+
+
+class _RecordingClient:
+    def __init__(self):
+        self.batches = []
+
+    def pipeline(self, transaction=False):
+        return _RecordingPipeline(self)
+
+
+def _connected_bus(client):
+    """A MessageBus wired to a fake publish client, with only the batching publisher running"""
+    bus = MessageBus()
+    bus.redis_client = client
+    bus._pub_client = client
+    bus._publish_queue = asyncio.Queue()
+    bus._publish_sem = asyncio.Semaphore(100)
+    return bus
+
+
+def _message():
+    return Message(type=MessageType.AGENT_STATUS, sender_id="tester", payload={})
+
+
+def test_handler_queue_delivers_lowest_priority_first():
+    async def scenario():
+        queue = _HandlerQueue(maxsize=10)
+        for item in [(5, 0, "a"), (1, 1, "b"), (9, 2, "c"), (1, 3, "d")]:
+            assert queue.put_evicting(item) is None
+        return [await queue.get() for _ in range(4)]
+
+    assert asyncio.run(scenario()) == [(1, 1, "b"), (1, 3, "d"), (5, 0, "a"), (9, 2, "c")]
+
+
+def test_handler_queue_evicts_worst_entry_when_full():
+    async def scenario():
+        queue = _HandlerQueue(maxsize=3)
+        for item in [(5, 0, "a"), (7, 1, "b"), (3, 2, "c")]:
+            queue.put_evicting(item)
+
+        evicted = queue.put_evicting((1, 3, "d"))
+        drained = [await queue.get() for _ in range(queue.qsize())]
+        return evicted, drained
+
+    evicted, drained = asyncio.run(scenario())
+    assert evicted == (7, 1, "b")
+    assert drained == [(1, 3, "d"), (3, 2, "c"), (5, 0, "a")]
+
+
+def test_handler_queue_rejects_item_worse_than_everything_queued():
+    async def scenario():
+        queue = _HandlerQueue(maxsize=2)
+        queue.put_evicting((2, 0, "a"))
+        queue.put_evicting((4, 1, "b"))
+
+        rejected = queue.put_evicting((9, 2, "c"))
+        drained = [await queue.get() for _ in range(queue.qsize())]
+        return rejected, drained
+
+    rejected, drained = asyncio.run(scenario())
+    assert rejected == (9, 2, "c")
+    assert drained == [(2, 0, "a"), (4, 1, "b")]
+
+
+def test_handler_queue_keeps_best_entries_under_sustained_overflow():
+    async def scenario():
+        queue = _HandlerQueue(maxsize=5)
+        items = [((seq * 7) % 10 + 1, seq, None) for seq in range(50)]
+        for item in items:
+            queue.put_evicting(item)
+        return items, [await queue.get() for _ in range(queue.qsize())]
+
+    items, drained = asyncio.run(scenario())
+    assert drained == sorted(items)[:5]
+
+
+def test_handler_queue_get_waits_for_put():
+    async def scenario():
+        queue = _HandlerQueue(maxsize=1)
+        getter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        assert not getter.done()
+
+        queue.put_evicting((5, 0, "a"))
+        return await asyncio.wait_for(getter, timeout=1)
+
+    assert asyncio.run(scenario()) == (5, 0, "a")
+
+
+def test_concurrent_publishes_share_one_pipeline(monkeypatch):
+    monkeypatch.setattr("src.core.message_bus.settings.redis_flush_interval_ms", 5.0)
+
+    async def scenario():
+        client = _RecordingClient()
+        bus = _connected_bus(client)
+        bus._flusher_task = asyncio.create_task(bus._flush_publishes())
+        try:
+            results = await asyncio.gather(*(bus.publish(f"ch{i}", _message()) for i in range(10)))
+        finally:
+            bus._flusher_task.cancel()
+            await asyncio.gather(bus._flusher_task, return_exceptions=True)
+        return results, client.batches
+
+    results, batches = asyncio.run(scenario())
+    assert results == [1] * 10
+    assert len(batches) == 1
+    assert sorted(batches[0]) == sorted(f"ch{i}" for i in range(10))
+
+
+def test_cancelling_flusher_fails_publishes_already_batched(monkeypatch):
+    # A long flush window leaves the flusher asleep holding the dequeued message
+    monkeypatch.setattr("src.core.message_bus.settings.redis_flush_interval_ms", 10_000.0)
+
+    async def scenario():
+        client = _RecordingClient()
+        bus = _connected_bus(client)
+        bus._flusher_task = asyncio.create_task(bus._flush_publishes())
+
+        publish = asyncio.create_task(bus.publish("ch", _message()))
+        await asyncio.sleep(0.01)
+        assert bus._publish_queue.empty() and not client.batches
+
+        bus._flusher_task.cancel()
+        await asyncio.gather(bus._flusher_task, return_exceptions=True)
+        with pytest.raises(RuntimeError, match="disconnected"):
+            await asyncio.wait_for(publish, timeout=1)
+
+    asyncio.run(scenario())